@@ -76,10 +76,12 @@ class Aboutfile(AboutPackageData, models.PackageDataFile):
         declared_license = package_data.get('license_expression')
         copyright_statement = package_data.get('copyright')
 
+        parties = []
         owner = package_data.get('owner')
-        if not isinstance(owner, str):
-            owner = repr(owner)
-        parties = [models.Party(type=models.party_person, name=owner, role='owner')]
+        if owner:
+            if not isinstance(owner, str):
+                owner = repr(owner)
+            parties.append(models.Party(type=models.party_person, name=owner, role='owner'))
 
         about_package = cls(
             type='about',
@@ -92,5 +94,7 @@ class Aboutfile(AboutPackageData, models.PackageDataFile):
             download_url=download_url,
         )
 
-        about_package.extra_data['about_resource'] = package_data.get('about_resource')
+        about_resource = package_data.get('about_resource')
+        if about_resource:
+            about_package.extra_data['about_resource'] = about_resource
         yield about_package
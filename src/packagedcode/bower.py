@@ -7,9 +7,9 @@
 # See https://aboutcode.org for more information about nexB OSS projects.
 #
 
-import io
-import json
+from functools import partial
 import logging
+import re
 
 import attr
 from packageurl import PackageURL
@@ -18,6 +18,21 @@ from commoncode import filetype
 from packagedcode import models
 from packagedcode.utils import combine_expressions
 
+try:
+    # use the faster orjson if available
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+def load_json(location):
+    """
+    Return the data loaded from the JSON file at ``location``.
+    The file is read at once as bytes and decoded by the JSON parser.
+    """
+    with open(location, 'rb') as loc:
+        return json_loads(loc.read())
+
 
 TRACE = False
 
@@ -61,8 +76,7 @@ class BowerJson(BowerPackageData, models.PackageDataFile):
         Yield one or more Package manifest objects given a file ``location`` pointing to a
         package archive, manifest or similar.
         """
-        with io.open(location, encoding='utf-8') as loc:
-            package_data = json.load(loc)
+        package_data = load_json(location)
 
         name = package_data.get('name')
         # FIXME: having no name may not be a problem See #1514
@@ -71,14 +85,7 @@ class BowerJson(BowerPackageData, models.PackageDataFile):
 
         description = package_data.get('description')
         version = package_data.get('version')
-        declared_license = package_data.get('license')
-        if declared_license:
-            if isinstance(declared_license, str):
-                declared_license = [declared_license]
-            elif isinstance(declared_license, (list, tuple)):
-                declared_license = [l for l in declared_license if l and l.strip()]
-            else:
-                declared_license = [repr(declared_license)]
+        declared_license = get_declared_license(package_data.get('license'))
 
         keywords = package_data.get('keywords') or []
 
@@ -108,29 +115,16 @@ class BowerJson(BowerPackageData, models.PackageDataFile):
             vcs_url = '{}+{}'.format(repo_type, repo_url)
 
         deps = package_data.get('dependencies') or {}
-        dependencies = []
-        for dep_name, requirement in deps.items():
-            dependencies.append(
-                models.DependentPackage(
-                    purl=PackageURL(type='bower', name=dep_name).to_string(),
-                    scope='dependencies',
-                    extracted_requirement=requirement,
-                    is_runtime=True,
-                    is_optional=False,
-                )
-            )
+        dependencies = [
+            runtime_dependency(purl=get_bower_purl(dep_name), extracted_requirement=requirement)
+            for dep_name, requirement in deps.items()
+        ]
 
         dev_dependencies = package_data.get('devDependencies') or {}
-        for dep_name, requirement in dev_dependencies.items():
-            dependencies.append(
-                models.DependentPackage(
-                    purl=PackageURL(type='bower', name=dep_name).to_string(),
-                    scope='devDependencies',
-                    extracted_requirement=requirement,
-                    is_runtime=False,
-                    is_optional=True,
-                )
-            )
+        dependencies.extend(
+            dev_dependency(purl=get_bower_purl(dep_name), extracted_requirement=requirement)
+            for dep_name, requirement in dev_dependencies.items()
+        )
 
         yield cls(
             name=name,
@@ -159,6 +153,68 @@ class BowerPackage(BowerPackageData, models.Package):
         ]
 
 
+# DependentPackage factories with the arguments shared by all the
+# dependencies of a scope
+runtime_dependency = partial(
+    models.DependentPackage,
+    scope='dependencies',
+    is_runtime=True,
+    is_optional=False,
+)
+
+dev_dependency = partial(
+    models.DependentPackage,
+    scope='devDependencies',
+    is_runtime=False,
+    is_optional=True,
+)
+
+
+# bower names made only of these characters need no purl quoting
+is_plain_bower_name = re.compile(r'[A-Za-z0-9_.\-]+').fullmatch
+
+
+def get_bower_purl(name):
+    """
+    Return a purl string for a bower package ``name``.
+    Build the string directly in the common case where no quoting is needed.
+
+    For example:
+    >>> get_bower_purl('jquery')
+    'pkg:bower/jquery'
+    """
+    if name and is_plain_bower_name(name):
+        return f'pkg:bower/{name}'
+    return PackageURL(type='bower', name=name).to_string()
+
+
+def get_declared_license(declared_license):
+    """
+    Return a list of declared license strings from a bower.json ``license``
+    field value or the empty value as-is.
+
+    For example:
+    >>> get_declared_license('MIT')
+    ['MIT']
+    >>> get_declared_license(['MIT', ' ', '', 'Apache-2.0'])
+    ['MIT', 'Apache-2.0']
+    >>> get_declared_license(None)
+    """
+    if not declared_license:
+        return declared_license
+
+    if isinstance(declared_license, str):
+        return [declared_license]
+
+    if isinstance(declared_license, (list, tuple)):
+        return [
+            l for l in declared_license
+            if l and isinstance(l, str) and not l.isspace()
+        ]
+
+    return [repr(declared_license)]
+
+
 def compute_normalized_license(declared_license):
     """
     Return a normalized license expression string detected from a list of
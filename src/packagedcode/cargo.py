@@ -7,12 +7,19 @@
 # See https://aboutcode.org for more information about nexB OSS projects.
 #
 
+from functools import lru_cache
+from functools import partial
+import json
 import logging
 import re
 
 import attr
 from packageurl import PackageURL
-import toml
+
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
 
 from commoncode import filetype
 from commoncode import fileutils
@@ -77,7 +84,8 @@ class CargoToml(RustCargoCrate, models.PackageDataFile):
         Yield one or more Package manifest objects given a file ``location`` pointing to a
         package archive, manifest or similar.
         """
-        package_data = toml.load(location, _dict=dict)
+        with open(location, 'rb') as fp:
+            package_data = tomllib.load(fp)
 
         core_package_data = package_data.get('package', {})
         name = core_package_data.get('name')
@@ -87,16 +95,32 @@ class CargoToml(RustCargoCrate, models.PackageDataFile):
             description = description.strip()
 
         authors = core_package_data.get('authors')
-        parties = list(party_mapper(authors, party_role='author'))
+        parties = party_mapper(authors, party_role='author')
 
         declared_license = core_package_data.get('license')
 
+        # dependencies are top-level tables and not part of the [package] table
+        dependencies = []
+        for scope in CARGO_DEPENDENCY_SCOPES:
+            deps = package_data.get(scope)
+            if deps:
+                dependencies.extend(dependency_mapper(deps, scope=scope))
+
+        # platform-specific dependencies such as [target.'cfg(unix)'.dependencies]
+        targets = package_data.get('target') or {}
+        for target_data in targets.values():
+            for scope in CARGO_DEPENDENCY_SCOPES:
+                deps = target_data.get(scope)
+                if deps:
+                    dependencies.extend(dependency_mapper(deps, scope=scope))
+
         package = cls(
             name=name,
             version=version,
             description=description,
             parties=parties,
-            declared_license=declared_license
+            declared_license=declared_license,
+            dependencies=dependencies,
         )
 
         yield package
@@ -122,26 +146,14 @@ class CargoLock(RustCargoCrate, models.PackageDataFile):
         Yield one or more Package manifest objects given a file ``location`` pointing to a
         package archive, manifest or similar.
         """
-        package_data = toml.load(location, _dict=dict)
-
-        package_dependencies = []
-        core_package_data = package_data.get('package', [])
-        for dep in core_package_data:
-            package_dependencies.append(
-                models.DependentPackage(
-                    purl=PackageURL(
-                        type='crates',
-                        name=dep.get('name'),
-                        version=dep.get('version')
-                    ).to_string(),
-                    extracted_requirement=dep.get('version'),
-                    scope='dependency',
-                    is_runtime=True,
-                    is_optional=False,
-                    is_resolved=True,
-                )
+        package_dependencies = [
+            locked_dependency(
+                purl=get_crate_purl(name=dep.get('name'), version=dep.get('version')),
+                extracted_requirement=dep.get('version'),
             )
-        
+            for dep in get_cargo_lock_packages(location)
+        ]
+
         yield cls(dependencies=package_dependencies)
 
 
@@ -160,24 +172,142 @@ class RustPackage(RustCargoCrate, models.Package):
         ]
 
 
+# DependentPackage factory with the arguments shared by all Cargo.lock packages
+locked_dependency = partial(
+    models.DependentPackage,
+    scope='dependency',
+    is_runtime=True,
+    is_optional=False,
+    is_resolved=True,
+)
+
+
+def get_cargo_lock_packages(location):
+    """
+    Return a list of [[package]] mappings from the Cargo.lock file at
+    ``location``. Each mapping has some of the "name", "version", "source" and
+    "checksum" keys.
+
+    Cargo.lock files are generated with a simple and regular structure, so
+    these are collected with a line-oriented scan rather than loading the
+    whole file as TOML. We fall back to a TOML parser if we find multi-line
+    or escaped strings, or if any package name or version is written in a
+    way that this scan cannot handle, such as with single quotes or comments.
+    """
+    with open(location, encoding='utf-8') as lock:
+        content = lock.read()
+
+    if '"""' not in content and "'''" not in content and '\\' not in content:
+        packages = []
+        # skip anything before the first [[package]] table
+        for block in split_cargo_lock_packages(content)[1:]:
+            # and anything after the end of this [[package]] table
+            block, _, _ = block.partition('\n[')
+            packages.append(dict(get_cargo_lock_package_fields(block)))
+
+        if all('name' in package and 'version' in package for package in packages):
+            return packages
+
+    with open(location, 'rb') as fp:
+        packages = tomllib.load(fp).get('package', [])
+    return [
+        {k: v for k, v in package.items() if k in CARGO_LOCK_PACKAGE_FIELDS}
+        for package in packages
+    ]
+
+
+CARGO_LOCK_PACKAGE_FIELDS = ('name', 'version', 'source', 'checksum',)
+
+
+split_cargo_lock_packages = re.compile(
+    r'^\[\[package\]\][ \t]*\r?$',
+    re.MULTILINE,
+).split
+
+get_cargo_lock_package_fields = re.compile(
+    r'^(name|version|source|checksum) = "([^"]*)"[ \t]*\r?$',
+    re.MULTILINE,
+).findall
+
+
+# crate names and versions made only of these characters need no purl quoting
+is_plain_purl_segment = re.compile(r'[A-Za-z0-9_.\-]+').fullmatch
+
+
+def get_crate_purl(name, version):
+    """
+    Return a purl string for a crate ``name`` and ``version``.
+    Build the string directly in the common case where no quoting is needed.
+
+    For example:
+    >>> get_crate_purl('serde', '1.0.136')
+    'pkg:cargo/serde@1.0.136'
+    """
+    if name and version and is_plain_purl_segment(name) and is_plain_purl_segment(version):
+        return f'pkg:cargo/{name}@{version}'
+    return PackageURL(type='cargo', name=name, version=version).to_string()
+
+
+CARGO_DEPENDENCY_SCOPES = (
+    'dependencies',
+    'dev-dependencies',
+    'build-dependencies',
+)
+
+
+def dependency_mapper(dependencies, scope='dependencies'):
+    """
+    Return a list of DependentPackage collected from a mapping of cargo
+    ``dependencies``.
+    https://doc.rust-lang.org/cargo/reference/specifying-dependencies.html
+    """
+    DependentPackage = models.DependentPackage
+    is_runtime = scope == 'dependencies'
+
+    dependent_packages = []
+    append = dependent_packages.append
+    for name, requirement in dependencies.items():
+        is_optional = False
+        if isinstance(requirement, dict):
+            # a renamed dependency uses the `package` name of the crate
+            name = requirement.get('package', name)
+            # a detailed requirement may have more than a version: we keep
+            # it as-is as a compact JSON string
+            requirement = dict(requirement)
+            is_optional = requirement.pop('optional', False)
+            requirement = json.dumps(requirement, sort_keys=True, separators=(',', ':'))
+
+        append(DependentPackage(
+            purl=PackageURL(type='cargo', name=name).to_string(),
+            extracted_requirement=requirement,
+            scope=scope,
+            is_runtime=is_runtime,
+            is_optional=is_optional,
+            is_resolved=False,
+        ))
+    return dependent_packages
+
+
 def party_mapper(party, party_role):
     """
-    Yields a Party object with party of `party_role`.
+    Return a list of Party objects with a `party_role` from a ``party`` list of
+    author strings.
     https://doc.rust-lang.org/cargo/reference/manifest.html#the-authors-field-optional
     """
-    for person in party:
-        name, email = parse_person(person)
-        yield models.Party(
-            type=models.party_person,
-            name=name,
-            role=party_role,
-            email=email)
+    Party = models.Party
+    party_person = models.party_person
+    return [
+        Party(type=party_person, name=name, role=party_role, email=email)
+        for name, email in map(parse_person, party or [])
+    ]
 
 
+@lru_cache(maxsize=4096)
 def parse_person(person):
     """
     https://doc.rust-lang.org/cargo/reference/manifest.html#the-authors-field-optional
     A "person" is an object with an optional "name" or "email" field.
+    Results are cached as the same authors are often found in many crates.
 
     A person can be in the form:
       "author": "Isaac Z. Schlueter <i@izs.me>"
@@ -192,28 +322,18 @@ def parse_person(person):
     """
 
     parsed = person_parser(person)
-    if not parsed:
-        name = None
-        parsed = person_parser_no_name(person)
-    else:
-        name = parsed.group('name')
-
+    name = parsed.group('name').strip() or None
     email = parsed.group('email')
-
-    if name:
-        name = name.strip()
     if email:
-        email = email.strip('<> ')
+        email = email.strip()
 
     return name, email
 
 
+# A single pattern for a "person" with an optional name and an optional email:
+# this always matches, possibly with an empty name.
 person_parser = re.compile(
-    r'^(?P<name>[^\(<]+)'
+    r'^(?P<name>[^\(<]*)'
     r'\s?'
-    r'(?P<email><([^>]+)>)?'
-).match
-
-person_parser_no_name = re.compile(
-    r'(?P<email><([^>]+)>)?'
+    r'(?:<(?P<email>[^>]+)>)?'
 ).match
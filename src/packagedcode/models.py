@@ -8,9 +8,10 @@
 #
 
 import fnmatch
+from functools import lru_cache
 import logging
 import os
-import sys
+import re
 
 import attr
 from packageurl import normalize_qualifiers
@@ -94,7 +95,7 @@ def logger_debug(*args):
 logger = logging.getLogger(__name__)
 
 if TRACE or TRACE_MERGING:
-    import logging
+    import sys
 
     logging.basicConfig(stream=sys.stdout)
     logger.setLevel(logging.DEBUG)
@@ -680,6 +681,50 @@ def compute_normalized_license(declared_license, expression_symbols=None):
         return 'unknown'
 
 
+@lru_cache(maxsize=1024)
+def get_file_patterns_matcher(file_patterns, ignore_case=False):
+    """
+    Return a callable that returns a truthy match if a file name matches any
+    of a ``file_patterns`` tuple of glob patterns. Matching is case-sensitive
+    unless ``ignore_case`` is True. All the patterns are compiled once in a
+    single regex.
+
+    For example:
+    >>> matcher = get_file_patterns_matcher(('Cargo.toml', '*.ABOUT'))
+    >>> assert matcher('Cargo.toml')
+    >>> assert matcher('foo.ABOUT')
+    >>> assert not matcher('cargo.toml')
+    >>> assert get_file_patterns_matcher(('.JAR', '.war'), ignore_case=True)('.jar')
+    >>> assert not get_file_patterns_matcher(())('Cargo.toml')
+    """
+    if not file_patterns:
+        return lambda filename: None
+    pattern = '|'.join(fnmatch.translate(fp) for fp in file_patterns)
+    flags = re.IGNORECASE if ignore_case else 0
+    return re.compile(pattern, flags).match
+
+
+@lru_cache(maxsize=1024)
+def get_substrings_matcher(substrings, ignore_case=False):
+    """
+    Return a callable that returns a truthy match if a string contains any of
+    a ``substrings`` tuple of plain strings. Matching is case-sensitive unless
+    ``ignore_case`` is True. All the substrings are compiled once in a single
+    regex.
+
+    For example:
+    >>> matcher = get_substrings_matcher(('zip archive', 'java archive'), ignore_case=True)
+    >>> assert matcher('Zip archive data, at least v2.0 to extract')
+    >>> assert not matcher('gzip compressed data')
+    >>> assert not get_substrings_matcher(())('Zip archive data')
+    """
+    if not substrings:
+        return lambda s: None
+    pattern = '|'.join(re.escape(s) for s in substrings)
+    flags = re.IGNORECASE if ignore_case else 0
+    return re.compile(pattern, flags).search
+
+
 @attr.s
 class PackageDataFile:
     """
@@ -724,22 +769,31 @@ class PackageDataFile:
 
         Sub-classes should override to implement their own package data file recognition.
         """
-        if not filetype.is_file(location):
+        # NOTE: this is called for every package data class on every file: we
+        # check the cheap file name first and only stat the file if it matches
+        filename = file_name(location)
+
+        if get_file_patterns_matcher(tuple(cls.file_patterns))(filename):
+            return filetype.is_file(location)
+
+        # Otherwise a file type, a mime type and an extension must all match.
+        # We check the cheap extension first and only then get the file and
+        # mime types that require reading the file with libmagic.
+        if not (cls.filetypes and cls.mimetypes and cls.extensions):
             return
 
-        filename = file_name(location)
+        _base_name, extension = splitext_name(location, is_file=True)
+        matches_extensions = get_file_patterns_matcher(tuple(cls.extensions), ignore_case=True)
+        if not matches_extensions(extension):
+            return
 
-        file_patterns = cls.file_patterns
-        if any(fnmatch.fnmatchcase(filename, metaf) for metaf in file_patterns):
-            return True
+        if not filetype.is_file(location):
+            return
 
         T = contenttype.get_type(location)
-        ftype = T.filetype_file.lower()
+        ftype = T.filetype_file
         mtype = T.mimetype_file
 
-        _base_name, extension = splitext_name(location, is_file=True)
-        extension = extension.lower()
-
         if TRACE:
             logger_debug(
                 'is_manifest: ftype:', ftype, 'mtype:', mtype,
@@ -747,24 +801,9 @@ class PackageDataFile:
                 'fname:', filename, 'ext:', extension,
             )
 
-        type_matched = False
-        if cls.filetypes:
-            type_matched = any(t in ftype for t in cls.filetypes)
-
-        mime_matched = False
-        if cls.mimetypes:
-            mime_matched = any(m in mtype for m in cls.mimetypes)
-
-        extension_matched = False
-        extensions = cls.extensions
-        if extensions:
-            extensions = (e.lower() for e in extensions)
-            extension_matched = any(
-                fnmatch.fnmatchcase(extension, ext_pat)
-                for ext_pat in extensions
-            )
-
-        if type_matched and mime_matched and extension_matched:
+        type_matched = get_substrings_matcher(tuple(cls.filetypes), ignore_case=True)(ftype)
+        mime_matched = get_substrings_matcher(tuple(cls.mimetypes))(mtype)
+        if type_matched and mime_matched:
             return True
 
     @classmethod
@@ -909,21 +948,26 @@ class Package:
         parent = resource.parent(codebase)
 
         paths_to_ignore = self.ignore_paths
+        # compute these once rather than for each resource
+        matches_file_patterns = get_file_patterns_matcher(
+            tuple(self.get_file_patterns(manifests=self.manifests))
+        )
 
-        for resource in parent.walk(codebase):
+        walk_kwargs = {}
+        if paths_to_ignore:
+            def is_ignored(res, codebase):
+                return any(path in res.path for path in paths_to_ignore)
+
+            # the descendants of an ignored directory are also ignored: this
+            # prunes the walk and avoids visiting these subtrees at all
+            walk_kwargs['ignored'] = is_ignored
+
+        for resource in parent.walk(codebase, **walk_kwargs):
             if resource.is_dir:
                 continue
 
-            if paths_to_ignore:
-                if any(
-                    path in resource.path
-                    for path in paths_to_ignore
-                ):
-                    continue
-
-            filename = file_name(resource.location)
-            file_patterns = self.get_file_patterns(manifests=self.manifests)
-            if any(fnmatch.fnmatchcase(filename, pattern) for pattern in file_patterns):
+            filename = resource.name
+            if matches_file_patterns(filename):
                 if not resource.package_data:
                     continue # Raise Exception(?)
 
@@ -1147,10 +1191,11 @@ class MeteorPackage(PackageData, PackageDataFile):
 
 @attr.s()
 class CpanModule(PackageData, PackageDataFile):
+    # NOTE: patterns are ordered from the most to the least common
     file_patterns = (
-        '*.pod',
         # TODO: .pm is not a package manifest
         '*.pm',
+        '*.pod',
         'MANIFEST',
         'Makefile.PL',
         'META.yml',
@@ -1264,7 +1309,7 @@ class AppleDmgPackage(PackageData, PackageDataFile):
 class IsoImagePackage(PackageData, PackageDataFile):
     filetypes = ('iso 9660 cd-rom', 'high sierra cd-rom',)
     mimetypes = ('application/x-iso9660-image',)
-    extensions = ('.iso', '.udf', '.img',)
+    extensions = ('.iso', '.img', '.udf',)
     default_type = 'iso'
 
 
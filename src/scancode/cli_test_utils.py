@@ -7,17 +7,26 @@
 # See https://aboutcode.org for more information about nexB OSS projects.
 #
 
+from difflib import unified_diff
+from functools import lru_cache
 import io
+from itertools import islice
 import json
+from operator import itemgetter
 import os
+import re
 import time
 
-import saneyaml
 from commoncode.system import on_windows
-from packageurl import PackageURL
 
 from scancode_config import scancode_root_dir
 
+try:
+    # use the faster orjson if available
+    from orjson import loads as orjson_loads
+except ImportError:
+    orjson_loads = None
+
 
 def run_scan_plain(
     options,
@@ -39,6 +48,8 @@ def run_scan_plain(
         options.append('--test-mode')
 
     if not env:
+        # execute() replaces the environment entirely when given a lib dir:
+        # pass a copy of ours so that PATH and friends are inherited
         env = dict(os.environ)
 
     scmd = u'scancode'
@@ -106,9 +117,8 @@ def run_scan_click(
         monkeypatch.setattr(click._termui_impl, 'isatty', lambda _: True)
         monkeypatch.setattr(click , 'get_terminal_size', lambda : (80, 43,))
 
-    if not env:
-        env = dict(os.environ)
-
+    # CliRunner only applies `env` as overrides on top of os.environ: there is
+    # no need to copy the whole environment
     runner = CliRunner()
 
     result = runner.invoke(cli.scancode, options, catch_exceptions=False, env=env)
@@ -210,12 +220,29 @@ def check_json_scan(
     if remove_instance_uuid or ignore_instance_uuid:
         expected = remove_uuid_from_scan(expected)
 
-    # NOTE we redump the JSON as a YAML string for easier display of
-    # the failures comparison/diff
     if results != expected:
-        expected = saneyaml.dump(expected)
-        results = saneyaml.dump(results)
-        assert results == expected
+        diff = get_json_diff(expected, results)
+        raise AssertionError(
+            f'Scan results differ from expected: {expected_file}\n{diff}')
+
+
+MAX_DIFF_LINES = 2000
+
+
+def get_json_diff(expected, results, max_lines=MAX_DIFF_LINES):
+    """
+    Return a unified diff text between the ``expected`` and ``results`` JSON
+    data, limited to its first ``max_lines`` lines.
+    """
+    expected = json.dumps(expected, indent=2, sort_keys=True).splitlines()
+    results = json.dumps(results, indent=2, sort_keys=True).splitlines()
+    diff = list(islice(
+        unified_diff(expected, results, 'expected', 'results', lineterm=''),
+        max_lines + 1,
+    ))
+    if len(diff) > max_lines:
+        diff[max_lines:] = ['...']
+    return '\n'.join(diff)
 
 
 def remove_uuid_from_scan(results):
@@ -248,33 +275,51 @@ def remove_uuid_from_scan(results):
 
 def remove_uuid_from_instances(instances, uuid_string_fields=[], uuid_list_fields=[]):
     """
-    Remove UUIDs from each of the instances in a list of instances (like files/packages/dependencies),
+    Remove UUIDs in place from each of the instances in a list of instances (like files/packages/dependencies),
     given the list of `uuid_string_fields` and/or `uuid_list_fields` from which to remove the UUIDs from.
     """
-    new_instances = []
-
     for instance in instances:
 
         for uuid_string_field in uuid_string_fields:
             uuid_string = instance.get(uuid_string_field, None)
             if uuid_string:
-                purl = PackageURL.from_string(uuid_string)
-                purl.qualifiers.pop("uuid", None)
-                instance[uuid_string_field] = purl.to_string()
-        
+                instance[uuid_string_field] = remove_uuid_from_purl(uuid_string)
+
         for uuid_list_field in uuid_list_fields:
             uuid_list = instance.get(uuid_list_field, None)
             if uuid_list:
-                new_uuids = []
-                for uuid in uuid_list:
-                    purl = PackageURL.from_string(uuid)
-                    purl.qualifiers.pop("uuid", None)
-                    new_uuids.append(purl.to_string())
-                instance[uuid_list_field] = new_uuids
+                instance[uuid_list_field] = [remove_uuid_from_purl(uuid) for uuid in uuid_list]
 
-        new_instances.append(instance)
 
-    return new_instances
+# a `uuid` purl qualifier with its separator and any next qualifier separator
+remove_uuid_qualifier = re.compile(r'(?P<sep>[?&])uuid=[^&#]*(?P<next>&?)').subn
+
+
+@lru_cache(maxsize=65536)
+def remove_uuid_from_purl(purl_string):
+    """
+    Return a ``purl_string`` purl string with its `uuid` qualifier removed.
+    The same package purls are referenced from many files so we cache these.
+
+    For example::
+    >>> remove_uuid_from_purl('pkg:npm/foo@1.0?uuid=fixed-uid-done-for-testing-5642512d1758')
+    'pkg:npm/foo@1.0'
+    >>> remove_uuid_from_purl('pkg:npm/foo@1.0?a=b&uuid=fixed-uid-done-for-testing&c=d#sub')
+    'pkg:npm/foo@1.0?a=b&c=d#sub'
+    """
+    # the purls in scans are canonical: stripping the qualifier as text keeps
+    # them canonical and is much faster than a parse and rebuild
+    stripped, count = remove_uuid_qualifier(
+        lambda m: m.group('sep') if m.group('next') else '',
+        purl_string,
+    )
+    if count:
+        return stripped
+
+    from packageurl import PackageURL
+    purl = PackageURL.from_string(purl_string)
+    purl.qualifiers.pop("uuid", None)
+    return purl.to_string()
 
 
 def load_json_result(location, remove_file_date=False):
@@ -287,9 +332,14 @@ def load_json_result(location, remove_file_date=False):
     To optionally also remove date attributes from "files" and "headers"
     entries, set the `remove_file_date` argument to True.
     """
-    with io.open(location, encoding='utf-8') as res:
-        scan_results = res.read()
-    return load_json_result_from_string(scan_results, remove_file_date)
+    if orjson_loads:
+        with open(location, 'rb') as res:
+            scan_results = orjson_loads(res.read())
+    else:
+        # parse from the file to avoid keeping a copy of its whole text
+        with io.open(location, encoding='utf-8') as res:
+            scan_results = json.load(res)
+    return cleanup_scan(scan_results, remove_file_date)
 
 
 def load_json_result_from_string(string, remove_file_date=False):
@@ -297,15 +347,7 @@ def load_json_result_from_string(string, remove_file_date=False):
     Load the JSON scan results `string` as UTF-8 JSON.
     """
     scan_results = json.loads(string)
-    # clean new headers attributes
-    streamline_headers(scan_results.get('headers', []))
-    # clean file_level attributes
-    for scanned_file in scan_results['files']:
-        streamline_scanned_file(scanned_file, remove_file_date)
-
-    # TODO: remove sort, this should no longer be needed
-    scan_results['files'].sort(key=lambda x: x['path'])
-    return scan_results
+    return cleanup_scan(scan_results, remove_file_date)
 
 
 def cleanup_scan(scan_results, remove_file_date=False):
@@ -320,7 +362,7 @@ def cleanup_scan(scan_results, remove_file_date=False):
         streamline_scanned_file(scanned_file, remove_file_date)
 
     # TODO: remove sort, this should no longer be needed
-    scan_results['files'].sort(key=lambda x: x['path'])
+    scan_results['files'].sort(key=itemgetter('path'))
     return scan_results
 
 
@@ -328,13 +370,14 @@ def streamline_errors(errors):
     """
     Modify the `errors` list in place to make it easier to test
     """
-    for i, error in enumerate(errors[:]):
-        error_lines = error.splitlines(True)
-        if len(error_lines) <= 1:
+    for i, error in enumerate(errors):
+        first_line_end = error.find('\n') + 1
+        if not first_line_end or first_line_end == len(error):
+            # a single line
             continue
         # keep only first and last line
-        cleaned_error = ''.join([error_lines[0] + error_lines[-1]])
-        errors[i] = cleaned_error
+        last_line_start = error.rfind('\n', 0, -1) + 1
+        errors[i] = error[:first_line_end] + error[last_line_start:]
 
 
 def streamline_headers(headers):
@@ -377,8 +420,9 @@ def check_jsonlines_scan(
 
     If `remove_file_date` is True, the file.date attribute is removed.
     """
+    loads = orjson_loads or json.loads
     with io.open(result_file, encoding='utf-8') as res:
-        results = [json.loads(line) for line in res]
+        results = [loads(line) for line in res]
 
     streamline_jsonlines_scan(results, remove_file_date)
 
@@ -395,9 +439,12 @@ def check_jsonlines_scan(
         results[0].pop('headers', None)
         expected[0].pop('headers', None)
 
-    expected = json.dumps(expected, indent=2, separators=(',', ': '))
-    results = json.dumps(results, indent=2, separators=(',', ': '))
-    assert results == expected
+    # NOTE we redump the JSON as a string for easier display of the failures
+    # comparison/diff
+    if results != expected:
+        expected = json.dumps(expected, indent=2, separators=(',', ': '))
+        results = json.dumps(results, indent=2, separators=(',', ': '))
+        assert results == expected
 
 
 def streamline_jsonlines_scan(scan_result, remove_file_date=False):
@@ -7,7 +7,7 @@
 # See https://aboutcode.org for more information about nexB OSS projects.
 #
 
-from collections import defaultdict
+from functools import lru_cache
 import re
 
 import attr
@@ -117,6 +117,7 @@ def build_summary(
             no_detection_counter += 1
 
     # Collect direct children existing summaries
+    append = candidate_texts.append
     for child in children:
         child_summaries = get_resource_summary(
             child,
@@ -128,7 +129,7 @@ def build_summary(
             count = child_summary['count']
             value = child_summary['value']
             if value:
-                candidate_texts.append(Text(value, value, count))
+                append(Text(value, value, count))
             else:
                 no_detection_counter += count
 
@@ -165,11 +166,7 @@ class Text(object):
     def normalize(self):
         if TRACE_TEXT:
             logger_debug('Text.normalize:', self)
-        key = self.key.lower()
-        key = ' '.join(key.split())
-        key = key.strip('.,').strip()
-        key = clean(key)
-        self.key = key.strip('.,').strip()
+        self.key = normalize_key(self.key)
 
     def transliterate(self):
         self.key = toascii(self.key, translit=True)
@@ -178,7 +175,7 @@ class Text(object):
         key = self.key
         if not isinstance(key, str):
             key = unidecode(key)
-        fp = fingerprints.generate(key)
+        fp = get_fingerprint(key)
 
         if TRACE_TEXT or TRACE_FP:
             logger_debug('Text.fingerprint:key: ', repr(self.key))
@@ -187,6 +184,33 @@ class Text(object):
         self.key = fp
 
 
+@lru_cache(maxsize=16384)
+def normalize_key(key):
+    """
+    Return a normalized, lowercased `key` string with collapsed whitespaces and
+    stripped leading and trailing punctuations. The same keys are found in many
+    files so we cache these.
+
+    For example:
+    >>> normalize_key('  The  FREE Software Foundation, Inc. ,')
+    'the free software foundation, inc'
+    """
+    key = ' '.join(key.lower().split())
+    key = clean(key)
+    # whitespaces are single spaces at this stage: strip any mix of leading
+    # and trailing dots, commas and spaces at once
+    return key.strip('., ')
+
+
+@lru_cache(maxsize=16384)
+def get_fingerprint(key):
+    """
+    Return a fingerprint string for a `key` string. The same keys are found in
+    many files and fingerprinting is costly so we cache these.
+    """
+    return fingerprints.generate(key)
+
+
 def summarize_copyrights(texts, _detector=CopyrightDetector()):
     """
     Return a summarized list of mapping of {value:string, count:int} given a
@@ -202,17 +226,7 @@ def summarize_copyrights(texts, _detector=CopyrightDetector()):
         if isinstance(text, Text):
             summary_texts.append(text)
         else:
-            # FIXME: redetect to strip year should not be needed!!
-            statements_without_years = _detector.detect(
-                [(1, text)],
-                include_copyrights=True,
-                include_holders=False,
-                include_authors=False,
-                include_copyright_years=False,
-            )
-
-            for detection in statements_without_years:
-                copyr = detection.copyright
+            for copyr in get_copyrights_without_years(text, _detector):
                 summary_texts.append(Text(copyr, copyr))
 
     counter = summarize(summary_texts)
@@ -222,6 +236,27 @@ def summarize_copyrights(texts, _detector=CopyrightDetector()):
     return counter
 
 
+@lru_cache(maxsize=4096)
+def get_copyrights_without_years(text, detector):
+    """
+    Return a tuple of copyright statements strings without years detected in a
+    `text` copyright string using a `detector` CopyrightDetector.
+
+    Each text is detected on its own as a copyright grammar may span lines and
+    would merge statements detected together. The same copyright statements are
+    found in many files so we cache these.
+    """
+    # FIXME: redetect to strip year should not be needed!!
+    statements_without_years = detector.detect(
+        [(1, text)],
+        include_copyrights=True,
+        include_holders=False,
+        include_authors=False,
+        include_copyright_years=False,
+    )
+    return tuple(detection.copyright for detection in statements_without_years)
+
+
 def summarize_persons(texts):
     """
     Return a summarized list of mapping of {value:string, count:int} given a
@@ -259,40 +294,28 @@ def summarize(summary_texts):
         for s in summary_texts:
             logger_debug('    ', s)
 
+    # NOTE: we call the cached key functions directly rather than the Text
+    # methods in these per-text loops. normalize_key() is idempotent and
+    # filter_junk() does not change keys: there is no need to normalize again
+    # the texts that are not junk
     for text in summary_texts:
-        text.normalize()
+        text.key = normalize_key(text.key)
 
     if TRACE_DEEP:
-        logger_debug('summarize: NORMALIZED 1 texts:')
+        logger_debug('summarize: NORMALIZED texts:')
         for s in summary_texts:
             logger_debug('      ', s)
 
-    texts = list(filter_junk(summary_texts))
+    # this also skips the texts with an empty key
+    texts = list(filter_junk(summary_texts, lowercased=True))
 
     if TRACE_DEEP:
         logger_debug('summarize: DEJUNKED texts:')
         for s in summary_texts:
             logger_debug('        ', s)
 
-    for t in texts:
-        t.normalize()
-
-    if TRACE_DEEP:
-        logger_debug('summarize: NORMALIZED 2 texts:')
-        for s in summary_texts:
-            logger_debug('          ', s)
-
-    # keep non-empties
-    texts = list(t for t in texts if t.key)
-
-    if TRACE_DEEP:
-        logger_debug('summarize: NON-EMPTY 1 texts:')
-        for s in summary_texts:
-            logger_debug('            ', s)
-
     # convert to plain ASCII, then fingerprint
-    for t in texts:
-        t.transliterate()
+    transliterate(texts)
 
     if TRACE_DEEP:
         logger_debug('summarize: ASCII texts:')
@@ -300,7 +323,7 @@ def summarize(summary_texts):
             logger_debug('              ', s)
 
     for t in texts:
-        t.fingerprint()
+        t.key = get_fingerprint(t.key)
 
     if TRACE_DEEP or TRACE_FP:
         logger_debug('summarize: FINGERPRINTED texts:')
@@ -332,32 +355,65 @@ def summarize(summary_texts):
     return counter
 
 
+# ASCII unit separator: this is a whitespace that cannot be found in normalized
+# keys and that is transliterated to itself
+KEYS_SEPARATOR = '\x1f'
+
+
+def is_ascii(s):
+    """
+    Return True if the `s` string contains only ASCII characters.
+
+    For example:
+    >>> is_ascii('Red Hat, Inc.')
+    True
+    >>> is_ascii('Ünïcödé GmbH')
+    False
+    """
+    # NOTE: str.isascii() is not available on Python 3.6
+    try:
+        s.encode('ascii')
+        return True
+    except UnicodeEncodeError:
+        return False
+
+
+def transliterate(texts):
+    """
+    Transliterate in place the keys of a `texts` list of normalized Text objects
+    to plain ASCII. Convert all the keys at once as a single joined string.
+    """
+    # ASCII keys are transliterated to themselves unless they contain the "[?]"
+    # unknown character marker that toascii() replaces
+    texts = [t for t in texts if not is_ascii(t.key) or '[?]' in t.key]
+    if not texts:
+        return
+    keys = toascii(KEYS_SEPARATOR.join(t.key for t in texts), translit=True)
+    for text, key in zip(texts, keys.split(KEYS_SEPARATOR)):
+        text.key = key
+
+
 def cluster(texts):
     """
     Given a `texts` iterable of Text objects, group these objects when they have the
     same key. Yield a tuple of (Text object, count of its occurences).
     """
-    clusters = defaultdict(list)
+    # mapping of {key: [representative Text, count]}
+    clusters = {}
     for text in texts:
-        clusters[text.key].append(text)
-
-    for cluster_key, cluster_texts in clusters.items():
-        try:
-            # keep the longest as the representative value for a cluster
-            cluster_texts.sort(key=lambda x:-len(x.key))
-            representative = cluster_texts[0]
-            count = sum(t.count for t in cluster_texts)
-            if TRACE_DEEP:
-                logger_debug('cluster: representative, count', representative, count)
-            yield representative, count
-        except Exception as e:
-            msg = (
-                f'Error in cluster(): cluster_key: {cluster_key!r}, '
-                f'cluster_texts: {cluster_texts!r}\n'
-            )
-            import traceback
-            msg += traceback.format_exc()
-            raise Exception(msg) from e
+        key = text.key
+        entry = clusters.get(key)
+        if entry is not None:
+            entry[1] += text.count
+        else:
+            # all the texts of a cluster have the same key: we keep the first
+            # one as the representative value for a cluster
+            clusters[key] = [text, text.count]
+
+    for representative, count in clusters.values():
+        if TRACE_DEEP:
+            logger_debug('cluster: representative, count', representative, count)
+        yield representative, count
 
 
 def clean(text):
@@ -463,18 +519,21 @@ JUNK_HOLDERS = frozenset([
 ])
 
 
-def filter_junk(texts):
+def filter_junk(texts, lowercased=False):
     """
     Filter junk from an iterable of texts objects.
+    If `lowercased` is True, the texts keys are known to be already lowercased,
+    such as after Text.normalize().
     """
     for text in texts:
-        if not text.key:
+        key = text.key
+        if not key:
             continue
-        if text.key.lower() in JUNK_HOLDERS:
+        if (key if lowercased else key.lower()) in JUNK_HOLDERS:
             continue
-        if text.key.isdigit():
+        if key.isdigit():
             continue
-        if len(text.key) == 1:
+        if len(key) == 1:
             continue
         yield text
 
@@ -558,13 +617,16 @@ COMMON_NAMES = {
 _keep_only_chars = re.compile('[_\\W]+', re.UNICODE).sub  # NOQA
 
 
+@lru_cache(maxsize=4096)
 def keep_only_chars(s):
     return _keep_only_chars('', s)
 
 
+@lru_cache(maxsize=4096)
 def canonical_holder(s):
     """
     Return a canonical holder for string `s` or s.
+    The same holders are found in many files so we cache these.
     """
     key = keep_only_chars(s).lower()
     cano = COMMON_NAMES.get(key)
@@ -33,3 +33,9 @@ class TestAbout(PackageTester):
         package = about.Aboutfile.recognize(test_file)
         expected_loc = self.get_test_loc('about/appdirs.ABOUT-expected')
         self.check_packages(package, expected_loc, regen=REGEN_TEST_FIXTURES)
+
+    def test_parse_about_file_without_owner_and_about_resource(self):
+        test_file = self.get_test_loc('about/noowner/noowner.ABOUT')
+        package = list(about.Aboutfile.recognize(test_file))[0]
+        assert package.parties == []
+        assert package.extra_data == {}
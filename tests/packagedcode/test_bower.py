@@ -39,3 +39,9 @@ class TestBower(PackageTester):
         package = bower.BowerJson.recognize(test_file)
         expected_loc = self.get_test_loc('bower/author-objects/expected.json')
         self.check_packages(package, expected_loc, regen=REGEN_TEST_FIXTURES)
+
+    def test_get_bower_purl_is_the_same_as_packageurl(self):
+        from packageurl import PackageURL
+        for name in ('jquery', 'foo\n', 'foo bar', '@scope/foo', 'foo.js'):
+            expected = PackageURL(type='bower', name=name).to_string()
+            assert bower.get_bower_purl(name) == expected
@@ -87,18 +87,53 @@ class TestCargo(PackageTester):
         package = cargo.CargoLock.recognize(test_file)
         self.check_packages(package, expected_loc, regen=REGEN_TEST_FIXTURES)
 
+    def test_parse_cargo_lock_sample6_with_non_canonical_toml(self):
+        test_file = self.get_test_loc('cargo/cargo_lock/sample6/Cargo.lock')
+        expected_loc = self.get_test_loc('cargo/cargo_lock/sample6/output.expected.json')
+        package = cargo.CargoLock.recognize(test_file)
+        self.check_packages(package, expected_loc, regen=REGEN_TEST_FIXTURES)
+
+    def test_get_cargo_lock_packages_is_the_same_as_toml(self):
+        for sample in ('sample1', 'sample2', 'sample3', 'sample4', 'sample5', 'sample6'):
+            test_file = self.get_test_loc(f'cargo/cargo_lock/{sample}/Cargo.lock')
+            with open(test_file, 'rb') as fp:
+                expected = [
+                    {k: v for k, v in package.items() if k in ('name', 'version', 'source', 'checksum')}
+                    for package in cargo.tomllib.load(fp)['package']
+                ]
+            assert cargo.get_cargo_lock_packages(test_file) == expected
+
+    def test_dependency_mapper_uses_package_name_of_renamed_dependencies(self):
+        dependencies = {
+            'foo': {'package': 'bar', 'version': '1', 'optional': True},
+            'baz': '0.2',
+        }
+        results = [
+            (d.purl, d.extracted_requirement, d.is_optional)
+            for d in cargo.dependency_mapper(dependencies)
+        ]
+        expected = [
+            ('pkg:cargo/bar', '{"package":"bar","version":"1"}', True),
+            ('pkg:cargo/baz', '0.2', False),
+        ]
+        assert results == expected
+
+    def test_get_crate_purl_is_the_same_as_packageurl(self):
+        from packageurl import PackageURL
+        for name, version in (('serde', '1.0.136'), ('foo', '1.0\n'), ('foo\n', '1.0'), ('foo', '1.0+bar')):
+            expected = PackageURL(type='cargo', name=name, version=version).to_string()
+            assert cargo.get_crate_purl(name, version) == expected
+
 
 PERSON_PARSER_TEST_TABLE = [
-    ('Barney Rubble <b@rubble.com>', ('Barney Rubble ', '<b@rubble.com>')),
+    ('Barney Rubble <b@rubble.com>', ('Barney Rubble ', 'b@rubble.com')),
     ('Barney Rubble', ('Barney Rubble', None)),
-    ('Some Good Guy <hisgoodmail@email.com>', ('Some Good Guy ', '<hisgoodmail@email.com>')),
+    ('Some Good Guy <hisgoodmail@email.com>', ('Some Good Guy ', 'hisgoodmail@email.com')),
     ('Some Good Guy', ('Some Good Guy', None)),
+    ('<b@rubble.com>', ('', 'b@rubble.com')),
+    ('<anotherguy@email.com>', ('', 'anotherguy@email.com')),
 ]
 
-PERSON_NO_NAME_PARSER_TEST_TABLE = [
-    ('<b@rubble.com>', (None, '<b@rubble.com>')),
-    ('<anotherguy@email.com>', (None, '<anotherguy@email.com>')),
-]
 
 class TestRegex(object):
     @pytest.mark.parametrize('person, expected_person', PERSON_PARSER_TEST_TABLE)
@@ -108,14 +143,10 @@ class TestRegex(object):
         name, email = person_information.get('name'), person_information.get('email')
         assert (name, email) == expected_person
 
-    def test_person_parser_no_name_failure(self):
-        person = '<emailwithoutname@email.com>'
-        parsed_person = cargo.person_parser(person)
-        assert parsed_person is None
-
-    @pytest.mark.parametrize('person, expected_person', PERSON_NO_NAME_PARSER_TEST_TABLE)
-    def test_person_parser_no_name(self, person, expected_person):
-        parsed_person = cargo.person_parser_no_name(person)
-        person_information = parsed_person.groupdict()
-        name, email = person_information.get('name'), person_information.get('email')
-        assert (name, email) == expected_person
+    @pytest.mark.parametrize('person, expected_person', [
+        ('Barney Rubble <b@rubble.com>', ('Barney Rubble', 'b@rubble.com')),
+        ('<emailwithoutname@email.com>', (None, 'emailwithoutname@email.com')),
+        ('Barney Rubble (https://rubble.com)', ('Barney Rubble', None)),
+    ])
+    def test_parse_person(self, person, expected_person):
+        assert cargo.parse_person(person) == expected_person